@@ -44,7 +44,7 @@ def ratio(matrix, objectives, weights):
 
     # calculate ranking by inner prodcut
     rank_mtx = np.inner(matrix, objective_x_weights)
-    score = np.squeeze(np.asarray(rank_mtx))
+    score = np.asarray(rank_mtx)
     return rank.rank_values(score, reverse=True), score
 
 
@@ -106,7 +106,7 @@ def refpoint(matrix, objectives, weights):
 
     # create rank matrix
     rank_mtx = np.max(np.abs(weights * (matrix - reference_point)), axis=1)
-    score = np.squeeze(np.asarray(rank_mtx))
+    score = np.asarray(rank_mtx)
     return rank.rank_values(score), score, reference_point
 
 
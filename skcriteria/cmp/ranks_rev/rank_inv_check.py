@@ -22,6 +22,8 @@ criterion remains the same.
 # IMPORTS
 # =============================================================================
 
+import joblib
+
 import numpy as np
 import numpy.lib.arraysetops as arrset
 
@@ -110,6 +112,13 @@ class RankInvariantChecker(SKCMethodABC):
         Controls the random state to generate variations in the sub-optimal
         alternatives.
 
+    n_jobs: int or None (default: None)
+        The maximum number of concurrently running jobs used to evaluate the
+        mutated decision matrices with ``dmaker``. ``None`` means 1 unless in
+        a :py:func:`joblib.parallel_backend` context, and ``-1`` means using
+        all processors. The mutations are always generated sequentially, so
+        the results do not depend on this value.
+
     """
 
     _skcriteria_dm_type = "rank_reversal"
@@ -119,6 +128,7 @@ class RankInvariantChecker(SKCMethodABC):
         "allow_missing_alternatives",
         "last_diff_strategy",
         "random_state",
+        "n_jobs",
     ]
 
     def __init__(
@@ -129,6 +139,7 @@ class RankInvariantChecker(SKCMethodABC):
         allow_missing_alternatives=False,
         last_diff_strategy="median",
         random_state=None,
+        n_jobs=None,
     ):
         if not (hasattr(dmaker, "evaluate") and callable(dmaker.evaluate)):
             raise TypeError("'dmaker' must implement 'evaluate()' method")
@@ -155,6 +166,9 @@ class RankInvariantChecker(SKCMethodABC):
         # RANDOM
         self._random_state = np.random.default_rng(random_state)
 
+        # PARALLELISM
+        self._n_jobs = n_jobs
+
     def __repr__(self):
         """x.__repr__() <==> repr(x)."""
         name = self.get_method_name()
@@ -199,6 +213,12 @@ class RankInvariantChecker(SKCMethodABC):
         sub-optimal alternatives."""
         return self._random_state
 
+    @property
+    def n_jobs(self):
+        """The maximum number of concurrently running jobs used to evaluate \
+        the mutated decision matrices."""
+        return self._n_jobs
+
     # LOGIC ===================================================================
 
     def _maximum_abs_noises(self, *, dm, rank):
@@ -494,6 +514,7 @@ class RankInvariantChecker(SKCMethodABC):
         allow_missing_alternatives = self.allow_missing_alternatives
         repeat = self.repeat
         random = self.random_state
+        n_jobs = self.n_jobs
 
         # all alternatives to be used to check consistency
         full_alternatives = dm.alternatives
@@ -514,16 +535,28 @@ class RankInvariantChecker(SKCMethodABC):
         names, results = ["Original"], [patched_orank]
 
         # START EXPERIMENTS ===================================================
-        mutants_generator = self._generate_mutations(
-            dm=dm,
-            orank=patched_orank,
-            repeat=repeat,
-            random=random,
-        )
-        for it, mutated, mdm, noise in mutants_generator:
-            # calculate the new rank
-            mrank = dmaker.evaluate(mdm)
 
+        # joblib pulls the mutations lazily and in order from this generator
+        # in the current process, so the random state is consumed the same
+        # way no matter how they are evaluated, and only the mutated
+        # matrices being dispatched are alive at the same time.
+        mutations_info = []
+
+        def mutated_evaluations():
+            mutants_generator = self._generate_mutations(
+                dm=dm,
+                orank=patched_orank,
+                repeat=repeat,
+                random=random,
+            )
+            for it, mutated, mdm, noise in mutants_generator:
+                mutations_info.append((it, mutated, noise))
+                yield joblib.delayed(dmaker.evaluate)(mdm)
+
+        # calculate the new ranks (every evaluation is independent)
+        mranks = joblib.Parallel(n_jobs=n_jobs)(mutated_evaluations())
+
+        for (it, mutated, noise), mrank in zip(mutations_info, mranks):
             # add info about the mutation to rhe rank
             patched_mrank = self._add_mutation_info_to_rank(
                 rank=mrank,
@@ -91,6 +91,15 @@ class Bunch(Mapping):
 
         return clone
 
+    def __setstate__(self, state):
+        """Restore the state of an unpickled bunch.
+
+        Without this method pickle looks for ``__setstate__`` through
+        ``__getattr__`` before ``_data`` exists, and recurses forever.
+
+        """
+        self.__dict__.update(state)
+
     def __iter__(self):
         """x.__iter__() <==> iter(x)."""
         return iter(self._data)
@@ -48,7 +48,7 @@ def is_solver_available(solver):
 
 class _Var(pulp.LpVariable):
     def __init__(self, name, low=None, up=None, *args, **kwargs):
-        super(_Var, self).__init__(
+        super().__init__(
             name=name,
             lowBound=low,
             upBound=up,
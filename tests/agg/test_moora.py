@@ -84,6 +84,20 @@ def test_RatioMOORA_kracka2010ranking():
     assert np.allclose(result.e_.score, expected.e_.score)
 
 
+def test_RatioMOORA_one_alternative():
+    dm = skcriteria.mkdm(
+        matrix=[[1, 2, 3]],
+        objectives=[max, max, max],
+    )
+
+    ranker = RatioMOORA()
+    result = ranker.evaluate(dm)
+
+    assert np.array_equal(result.values, [1])
+    assert result.e_.score.shape == (1,)
+    assert np.allclose(result.e_.score, [6.0])
+
+
 # =============================================================================
 # REFPOINT
 # =============================================================================
@@ -147,6 +161,20 @@ def test_ReferencePointMOORA_kracka2010ranking():
     assert np.allclose(result.e_.reference_point, expected.e_.reference_point)
 
 
+def test_ReferencePointMOORA_one_alternative():
+    dm = skcriteria.mkdm(
+        matrix=[[1, 2, 3]],
+        objectives=[max, max, max],
+    )
+
+    ranker = ReferencePointMOORA()
+    result = ranker.evaluate(dm)
+
+    assert np.array_equal(result.values, [1])
+    assert result.e_.score.shape == (1,)
+    assert np.allclose(result.e_.score, [0.0])
+
+
 # =============================================================================
 # FMF
 # =============================================================================
@@ -24,7 +24,12 @@ import pytest
 
 import skcriteria
 from skcriteria.agg import RankResult
-from skcriteria.agg.simple import WeightedProductModel, WeightedSumModel
+from skcriteria.agg.simple import (
+    WeightedProductModel,
+    WeightedSumModel,
+    wpm,
+    wpm_score,
+)
 from skcriteria.preprocessing.invert_objectives import InvertMinimize
 from skcriteria.preprocessing.scalers import SumScaler
 
@@ -52,6 +57,20 @@ def test_WeightedSumModel():
     assert np.all(result.e_.score == expected.e_.score)
 
 
+def test_WeightedSumModel_one_alternative():
+    dm = skcriteria.mkdm(
+        matrix=[[1, 2, 3]],
+        objectives=[max, max, max],
+    )
+
+    ranker = WeightedSumModel()
+    result = ranker.evaluate(dm)
+
+    assert np.array_equal(result.values, [1])
+    assert result.e_.score.shape == (1,)
+    assert np.all(result.e_.score == [6.0])
+
+
 def test_WeightedSumModel_minimize_fail():
     dm = skcriteria.mkdm(
         matrix=[[1, 0, 3], [0, 5, 6]],
@@ -76,6 +95,18 @@ def test_WeightedProductModel_lt0_fail():
         ranker.evaluate(dm)
 
 
+def test_WeightedSumModel_nan_and_lt0_fail():
+    dm = skcriteria.mkdm(
+        matrix=[[np.nan, -1, 2], [1, 2, 3]],
+        objectives=[max, max, max],
+    )
+
+    ranker = WeightedSumModel()
+
+    with pytest.raises(ValueError):
+        ranker.evaluate(dm)
+
+
 def test_WeightedSumModel_kracka2010ranking():
     """
     Data from:
@@ -156,6 +187,57 @@ def test_WeightedProductModel():
     assert np.allclose(result.e_.score, expected.e_.score)
 
 
+def test_WeightedProductModel_float32():
+    dm = skcriteria.mkdm(
+        matrix=[[1, 2, 3], [4, 5, 6]],
+        objectives=[max, max, max],
+    )
+
+    expected = RankResult(
+        "WeightedProductModel",
+        ["A0", "A1"],
+        [2, 1],
+        {"score": [0.77815125, 2.07918125]},
+    )
+
+    ranker = WeightedProductModel(dtype=np.float32)
+    result = ranker.evaluate(dm)
+
+    assert ranker.dtype == np.float32
+    assert result.values_equals(expected)
+    assert result.e_.score.dtype == np.float32
+    assert np.allclose(result.e_.score, expected.e_.score)
+
+
+def test_WeightedProductModel_float32_underflow_fail():
+    dm = skcriteria.mkdm(
+        matrix=[[1e-50, 2], [3, 4]],
+        objectives=[max, max],
+    )
+
+    ranker = WeightedProductModel(dtype=np.float32)
+
+    with pytest.raises(ValueError):
+        ranker.evaluate(dm)
+
+
+def test_WeightedProductModel_float32_overflow_fail():
+    dm = skcriteria.mkdm(
+        matrix=[[1e50, 2], [3, 4]],
+        objectives=[max, max],
+    )
+
+    ranker = WeightedProductModel(dtype=np.float32)
+
+    with pytest.raises(ValueError, match="can't represent"):
+        ranker.evaluate(dm)
+
+
+def test_WeightedProductModel_invalid_dtype():
+    with pytest.raises(ValueError):
+        WeightedProductModel(dtype=int)
+
+
 def test_WeightedProductModel_minimize_fail():
     dm = skcriteria.mkdm(
         matrix=[[1, 2, 3], [4, 5, 6]],
@@ -180,6 +262,18 @@ def test_WeightedProductModel_with0_fail():
         ranker.evaluate(dm)
 
 
+def test_WeightedProductModel_nan_and_lt0_fail():
+    dm = skcriteria.mkdm(
+        matrix=[[np.nan, -1, 2], [1, 2, 3]],
+        objectives=[max, max, max],
+    )
+
+    ranker = WeightedProductModel()
+
+    with pytest.raises(ValueError):
+        ranker.evaluate(dm)
+
+
 def test_WeightedProductModel_enwiki_1015567716():
     """
     Data from:
@@ -214,3 +308,32 @@ def test_WeightedProductModel_enwiki_1015567716():
     assert result.values_equals(expected)
     assert result.method == expected.method
     assert np.allclose(result.e_.score, expected.e_.score)
+
+
+def test_wpm_score():
+    matrix = np.array([[1, 2, 3], [4, 5, 6]])
+    weights = np.array([1, 1, 1])
+
+    score = wpm_score(matrix, weights)
+    rank, wpm_result_score = wpm(matrix, weights)
+
+    assert np.allclose(score, [0.77815125, 2.07918125])
+    assert np.array_equal(score, wpm_result_score)
+    assert np.array_equal(rank, [2, 1])
+
+
+def test_wpm_stacked_matrices():
+    matrices = np.array(
+        [
+            [[1, 2, 3], [4, 5, 6]],
+            [[4, 5, 6], [1, 2, 3]],
+        ]
+    )
+    weights = np.array([1, 1, 1])
+
+    rank, score = wpm(matrices, weights)
+
+    assert score.shape == (2, 2)
+    assert np.allclose(score[0], wpm_score(matrices[0], weights))
+    assert np.allclose(score[1], wpm_score(matrices[1], weights))
+    assert np.array_equal(rank, [[2, 1], [1, 2]])
@@ -26,6 +26,7 @@ import pytest
 import skcriteria as skc
 from skcriteria.agg.similarity import TOPSIS
 from skcriteria.cmp.ranks_rev.rank_inv_check import RankInvariantChecker
+from skcriteria.testing import assert_rcmp_equals
 from skcriteria.utils import rank
 
 # =============================================================================
@@ -102,6 +103,40 @@ def test_RankInvariantChecker_van2021evaluation(windows_size):
     assert original_dominates_mutated(dm, result, "DOGE")
 
 
+def test_RankInvariantChecker_n_jobs():
+    dm = skc.datasets.load_simple_stock_selection()
+    dmaker = TOPSIS()
+
+    sequential = RankInvariantChecker(dmaker, random_state=42)
+    parallel = RankInvariantChecker(dmaker, random_state=42, n_jobs=2)
+
+    assert parallel.n_jobs == 2
+
+    assert_rcmp_equals(sequential.evaluate(dm), parallel.evaluate(dm))
+
+
+def test_RankInvariantChecker_mutations_are_lazy():
+    dm = skc.datasets.load_simple_stock_selection()
+    generated, evaluated_at = [], []
+
+    class CountMutationsChecker(RankInvariantChecker):
+        def _mutate_dm(self, **kwargs):
+            generated.append(kwargs["mutate"])
+            return super()._mutate_dm(**kwargs)
+
+    class RecordDMaker:
+        def evaluate(self, dm):
+            evaluated_at.append(len(generated))
+            return TOPSIS().evaluate(dm)
+
+    rrt1 = CountMutationsChecker(RecordDMaker(), random_state=42, repeat=2)
+    rrt1.evaluate(dm)
+
+    # the original rank is evaluated before any mutation, and then every
+    # mutation is evaluated right after it is generated
+    assert evaluated_at == list(range(len(generated) + 1))
+
+
 # REMOVE AN ALTERNATIVE =======================================================
 
 
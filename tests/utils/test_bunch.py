@@ -19,6 +19,7 @@
 # =============================================================================
 
 import copy
+import pickle
 
 import pytest
 
@@ -88,6 +89,16 @@ def test_Bunch_copy():
     assert md._data == md_c._data and md._data is md_c._data
 
 
+def test_Bunch_pickle():
+    md = bunch.Bunch("foo", {"alfa": 1})
+    md_p = pickle.loads(pickle.dumps(md))
+
+    assert md is not md_p
+    assert md._name == md_p._name
+    assert md._data == md_p._data
+    assert md_p.alfa == 1
+
+
 def test_Bunch_data_is_not_a_mapping():
     with pytest.raises(TypeError, match="Data must be some kind of mapping"):
         bunch.Bunch("foo", None)
@@ -44,6 +44,70 @@ def test_rank_reverse():
     assert np.all(result == expected)
 
 
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint64])
+def test_rank_reverse_unsigned(dtype):
+    values = np.array([0, 1, 2], dtype=dtype)
+    expected = [3, 2, 1]
+    result = rank.rank_values(values, reverse=True)
+    assert np.all(result == expected)
+
+
+def test_rank_reverse_bool():
+    values = np.array([True, False, True])
+    expected = [1, 2, 1]
+    result = rank.rank_values(values, reverse=True)
+    assert np.all(result == expected)
+
+
+def test_rank_ties_and_flatten():
+    values = [[0.5, 0.2], [0.5, 0.8]]
+    expected = [2, 1, 2, 3]
+    result = rank.rank_values(values)
+    assert np.all(result == expected)
+    assert result.dtype == np.int64
+
+
+def test_rank_axis():
+    values = [[0.5, 0.2, 0.6, 0.8], [0.1, 0.9, 0.9, 0.3]]
+    expected = [[3, 4, 2, 1], [3, 1, 1, 2]]
+    result = rank.rank_values(values, reverse=True, axis=1)
+    assert np.all(result == expected)
+
+
+def test_rank_axis_nan_last():
+    values = [[0.5, np.nan, 0.2], [1, 2, 3]]
+    expected = [[2, 3, 1], [1, 2, 3]]
+    result = rank.rank_values(values, axis=1)
+    assert np.all(result == expected)
+    assert result.dtype == np.int64
+    assert np.all(result[0] == rank.rank_values(values[0]))
+
+
+def test_rank_axis_empty():
+    result = rank.rank_values(np.empty((0, 3)), axis=1)
+    assert result.shape == (0, 3)
+    assert result.dtype == np.int64
+
+
+def test_rank_nan_last():
+    values = [0.5, np.nan, 0.2, np.nan]
+    assert np.all(rank.rank_values(values) == [2, 3, 1, 3])
+    assert np.all(rank.rank_values(values, reverse=True) == [1, 3, 2, 3])
+
+
+@pytest.mark.parametrize("axis", [0, -1])
+def test_rank_1d_valid_axis(axis):
+    values = [0.5, 0.2, 0.6, 0.8]
+    expected = [2, 1, 3, 4]
+    result = rank.rank_values(values, axis=axis)
+    assert np.all(result == expected)
+
+
+def test_rank_1d_invalid_axis():
+    with pytest.raises(IndexError):
+        rank.rank_values([0.5, 0.2, 0.6, 0.8], axis=1)
+
+
 @pytest.mark.parametrize(
     "ra, rb",
     [